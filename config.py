@@ -1,22 +1,47 @@
+import re
+
 # Set of image file extensions to look for (lowercase)
-IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.avif', '.webp', '.svg'}
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.avif', '.webp', '.svg'})
+
+# The script patterns are bytes: .rpy files are scanned without decoding them first.
+# \x80-\xff in the name classes admits UTF-8 encoded non-ASCII characters, which
+# bytes-mode \w does not match. Quoted strings use [^"\n]* rather than a lazy .*?,
+# so matching never backtracks and stays linear in the line length.
+# Whitespace between tokens is [ \t], never \s, so no match crosses a line break.
 
 # Regex for finding image usage (show/scene) in .rpy files
 # Handles optional attributes after the image name
 # Example: show eileen happy
 # Example: scene bg room
-SCENE_PATTERN = r'^\s*scene\s+([\w\/.-]+)'
-
-SHOW_PATTERN = r'^\s*show\s+([\w\/.-]+)'
+# [ \t]+ rather than \s+ after the keyword: a bare 'scene' (clears the layer) must not
+# run into the next line and capture its 'show' as the image name
+SHOW_SCENE_PATTERN = rb'^[ \t]*(?:show|scene)[ \t]+([\w\x80-\xff/.-]+)'
 
 # Regex for finding image definitions in .rpy files
 # Example: image logo = "images/logo.png"
 # Catches the defined name (e.g., 'logo')
-DEFINE_IMAGE_PATTERN = r'^\s*image\s+([\w\/-]+)\s*=\s*".*?"' # Allow '/' for paths
+DEFINE_IMAGE_PATTERN = rb'^[ \t]*image[ \t]+([\w\x80-\xff/-]+)[ \t]*=[ \t]*"[^"\n]*"' # Allow '/' for paths
 
 # Regex for finding imagebutton definitions and extracting image paths
 # Example: imagebutton auto "images/button_%s.png" action NullAction()
-IMAGEBUTTON_PATTERN = r'imagebutton\s+(?:auto\s+)?(?:hover\s*)?"(.*?)"'
+IMAGEBUTTON_PATTERN = rb'imagebutton[ \t]+(?:auto[ \t]+)?(?:hover[ \t]*)?"([^"\n]*)"'
+
+# All three patterns as one alternation, so a script is scanned in a single pass.
+# Matches of an alternation never overlap, so none of the patterns may run past the
+# end of its line ([ \t] instead of \s between tokens); otherwise a match would hide
+# a reference starting on the next line that a separate scan would have found.
+# m.lastgroup tells which kind of reference matched ('scene', 'imgdef' or 'imgbtn');
+# the captured name/path is always the group right after it: m.group(m.lastindex + 1).
+# findall() returns (scene, scene_ref, imgdef, imgdef_ref, imgbtn, imgbtn_path) tuples.
+COMBINED_RE = re.compile(
+    rb'(?P<scene>' + SHOW_SCENE_PATTERN + rb')'
+    rb'|(?P<imgdef>' + DEFINE_IMAGE_PATTERN + rb')'
+    rb'|(?P<imgbtn>' + IMAGEBUTTON_PATTERN + rb')',
+    re.IGNORECASE | re.MULTILINE
+)
 
 # Directory names commonly used for scripts in Ren'Py projects
-SCRIPT_DIR_NAMES = ["game", "script", "scripts"]
\ No newline at end of file
+SCRIPT_DIR_NAMES = ["game", "script", "scripts"]
+
+# Directory names that never hold project images; the image scan does not descend into them
+PRUNE_DIR_NAMES = frozenset({'.git', '__pycache__', 'tl', 'cache'}) | frozenset(SCRIPT_DIR_NAMES)
@@ -2,43 +2,119 @@
 Utility functions for finding and potentially managing image files.
 """
 
+import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Set, Any
+from typing import Callable, Iterator, Optional, Set
 
-from config import IMAGE_EXTENSIONS
+from config import IMAGE_EXTENSIONS, PRUNE_DIR_NAMES
 
-def get_image_names(images_dir: Path) -> set[Any] | tuple[set[str], set[str]]:
+# Optional dependency for moving files to the trash instead of deleting them
+try:
+    from send2trash import send2trash
+
+    TRASH_SUPPORT = True
+except ImportError:
+    send2trash = None
+    TRASH_SUPPORT = False
+
+
+# Tuple for str.endswith, which checks all suffixes in C without splitting the name
+_IMAGE_SUFFIXES = tuple(IMAGE_EXTENSIONS)
+
+
+def iter_files(root: Path, suffixes: tuple[str, ...], prune_dirs: frozenset[str] = frozenset(),
+               ignore_case: bool = False) -> Iterator[os.DirEntry]:
     """
-    Recursively finds all image files in the specified directory and returns
-    a set of their base names (filename + extension).
+    Lazily yields a DirEntry for every file below root whose name ends with one
+    of the given suffixes, like Path.rglob('*<suffix>').
+
+    Walks with os.scandir and an explicit stack, so directory checks use the
+    cached dirent type instead of a stat() per entry. As with Path.rglob(),
+    symlinked directories are not followed while symlinked files are yielded
+    (broken links are not). Unreadable or missing directories are silently
+    skipped, and subdirectories named in prune_dirs are not entered.
+
+    Args:
+        root: The directory to walk.
+        suffixes: Filename endings to match, e.g. ('.rpy',).
+        prune_dirs: Subdirectory names that are not scanned.
+        ignore_case: Match the suffixes against the lowercased name; the
+                     suffixes must then be given in lowercase.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in prune_dirs:
+                            stack.append(entry.path)
+                        continue
+                    name = entry.name.lower() if ignore_case else entry.name
+                    if name.endswith(suffixes) and entry.is_file():
+                        yield entry
+        except OSError:
+            continue # Unreadable or vanished directory
+
+
+def iter_image_files(images_dir: Path, prune_dirs: frozenset[str] = PRUNE_DIR_NAMES) -> Iterator[os.DirEntry]:
+    """
+    Lazily yields a DirEntry for every image file below images_dir, matching
+    the extensions case-insensitively and skipping subdirectories named in prune_dirs.
+
+    Nothing is collected up front, so callers can stop as soon as they have
+    what they need. A missing directory yields nothing.
+    """
+    return iter_files(images_dir, _IMAGE_SUFFIXES, prune_dirs, ignore_case=True)
+
+
+def get_image_stem_map(images_dir: Path,
+                       prune_dirs: frozenset[str] = PRUNE_DIR_NAMES) -> dict[str, list[str]]:
+    """
+    Recursively finds all image files in the specified directory and groups
+    their absolute paths (using '/') by base name (filename without extension).
+
+    Collecting both in one walk lets callers map unused names back to files
+    without scanning the directory again or re-parsing every path.
 
     Args:
         images_dir: The Path object representing the root images directory.
+        prune_dirs: Subdirectory names that are not scanned (scripts, translations,
+                    caches, ...). Pass frozenset() to scan everything.
 
     Returns:
-        A set containing the unique names (e.g., 'image1.png', 'photo.jpg')
-        of all image files found. Duplicate filenames found in different
-        subdirectories will only appear once in the set.
+        A dict mapping each image name to the list of files with that name.
     """
-    image_paths: Set[str] = set()
-    image_names: Set[str] = set()
-
     print(f"Scanning for images in: {images_dir.resolve()}") # Using resolve() for a clear absolute path in the message
 
+    stem_map: defaultdict[str, list[str]] = defaultdict(list)
     if not images_dir.is_dir():
         print(f"Warning: Images directory does not exist: {images_dir}")
-        return set() # Return an empty set
+        return stem_map
 
-    for filepath in images_dir.rglob("*"):
-        if filepath.is_file() and filepath.suffix.lower() in IMAGE_EXTENSIONS:
-            image_paths.add(filepath.absolute().as_posix())
-            image_names.add(filepath.stem)
+    for entry in iter_image_files(images_dir, prune_dirs):
+        stem_map[os.path.splitext(entry.name)[0]].append(os.path.abspath(entry.path).replace(os.sep, "/"))
 
-    print(f"Found {len(image_paths)} unique image filenames.")
-    return image_paths, image_names
+    print(f"Found {sum(map(len, stem_map.values()))} unique image filenames.")
+    return stem_map
 
 
-def perform_safe_deletion(files_to_delete: Set[Path], base_images_dir: Path) -> tuple[int, int]:
+def _log_deletion_error(log: Callable[[str], None], file_path: Path, base_images_dir: Path, error: Exception):
+    """Logs a failed deletion, relative to base_images_dir when possible."""
+    try:
+        relative_path = file_path.relative_to(base_images_dir)
+        log(f"Error deleting {relative_path}: {error}")
+    except ValueError:
+        log(f"Error deleting {file_path}: {error}")
+
+
+def perform_safe_deletion(files_to_delete: Set[Path], base_images_dir: Path,
+                          use_trash: bool = False, verbose: bool = True,
+                          workers: int = 1) -> tuple[int, int, Set[Path]]:
     """
     Safely deletes the specified files, ensuring they are within the base_images_dir.
 
@@ -46,51 +122,93 @@ def perform_safe_deletion(files_to_delete: Set[Path], base_images_dir: Path) ->
         files_to_delete: A set of Path objects for files marked for deletion.
         base_images_dir: The root directory where images were scanned. Files outside
                          this directory (considering subdirectories) will not be deleted.
+        use_trash: Move files to the system trash via 'send2trash' instead of
+                   deleting them permanently.
+        verbose: Print the start banner and summary line. Per-file lines are always printed.
+        workers: Number of threads removing files concurrently. Ignored with use_trash.
 
     Returns:
-        A tuple containing (number_of_files_deleted, number_of_errors_or_skips).
+        A tuple containing (number_of_files_deleted, number_of_errors_or_skips,
+        set_of_deleted_files). The set holds the Path objects as passed in.
     """
+    if use_trash and send2trash is None:
+        print("Error: Moving files to the trash requires 'send2trash'. Nothing was deleted.")
+        print("Install using: pip install send2trash")
+        return 0, len(files_to_delete), set()
+    remove = send2trash if use_trash else os.unlink
+
     deleted_count = 0
     error_count = 0
+    deleted_files: Set[Path] = set()
     base_images_dir_abs = base_images_dir.resolve()
-    print("\n--- Starting Deletion ---")
-
-    files_to_process = sorted(list(files_to_delete)) # Process in a consistent order
-
-    for file_path in files_to_process:
-        try:
-            file_path_abs = file_path.resolve()
+    # Trailing separator, so 'images2/x.png' does not pass as inside 'images'
+    base_prefix = os.path.join(os.fspath(base_images_dir_abs), '')
+    base_prefix_len = len(base_prefix)
+    # Log lines are written in one go after the loop instead of a print per file;
+    # deleted files are listed together under a single header
+    log_lines: list[str] = []
+    deleted_lines: list[str] = []
+    log = log_lines.append
+    if verbose:
+        print("\n--- Starting Deletion ---")
+
+    # Group by directory (in a consistent order) so each directory is handled in one run
+    files_by_dir: defaultdict[Path, list[Path]] = defaultdict(list)
+    for file_path in sorted(files_to_delete, key=os.fspath):
+        files_by_dir[file_path.parent].append(file_path)
+
+    # Safety checks first; the files that pass are removed afterwards, optionally in parallel
+    targets: list[tuple[Path, str]] = []
+    for parent, dir_files in files_by_dir.items():
+        parent_prefix = None # Each distinct parent directory is resolved only once
+        for file_path in dir_files:
+            try:
+                if parent_prefix is None:
+                    parent_prefix = os.path.join(os.fspath(parent.resolve()), '')
+            except Exception as e:
+                _log_deletion_error(log, file_path, base_images_dir, e)
+                error_count += 1
+                continue
+            abs_s = parent_prefix + file_path.name
             # Crucial Safety Check: Ensure the file is truly within the base images directory
-            if base_images_dir_abs not in file_path_abs.parents:
-                 # Also handle case where file is directly IN base_images_dir_abs
-                 if file_path_abs.parent != base_images_dir_abs:
-                    print(f"Safety Skip: {file_path.name} resolved to {file_path_abs}, which is outside the intended base images directory {base_images_dir_abs}")
-                    error_count += 1
-                    continue
-
-            if file_path_abs.exists():
-                file_path_abs.unlink()
-                try:
-                    # Show relative path for clarity if possible
-                    relative_path = file_path_abs.relative_to(base_images_dir_abs)
-                    print(f"Deleted: {relative_path}")
-                except ValueError:
-                    print(f"Deleted: {file_path_abs}") # Fallback if relative path fails
-                deleted_count += 1
-            else:
-                try:
-                    relative_path = file_path_abs.relative_to(base_images_dir_abs)
-                    print(f"Skipped (already deleted?): {relative_path}")
-                except ValueError:
-                    print(f"Skipped (already deleted?): {file_path_abs}")
+            if not abs_s.startswith(base_prefix):
+                log(f"Safety Skip: {file_path.name} resolved to {abs_s}, which is outside the intended base images directory {base_images_dir_abs}")
+                error_count += 1
+                continue
+            targets.append((file_path, abs_s))
 
+    def attempt(abs_s: str) -> Optional[Exception]:
+        try:
+            remove(abs_s)
         except Exception as e:
-            try:
-                relative_path = file_path.relative_to(base_images_dir)
-                print(f"Error deleting {relative_path}: {e}")
-            except ValueError:
-                 print(f"Error deleting {file_path}: {e}")
+            return e
+        return None
+
+    target_paths = [abs_s for _, abs_s in targets]
+    if workers > 1 and not use_trash and len(targets) > 1:
+        # unlink() releases the GIL, so slow (e.g. network) storage is hit concurrently
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(attempt, target_paths))
+    else:
+        outcomes = list(map(attempt, target_paths))
+
+    for (file_path, abs_s), error in zip(targets, outcomes):
+        # Show relative path for clarity
+        relative_path = abs_s[base_prefix_len:]
+        if error is None:
+            deleted_lines.append(relative_path)
+            deleted_count += 1
+            deleted_files.add(file_path)
+        elif isinstance(error, FileNotFoundError):
+            log(f"Skipped (already deleted?): {relative_path}")
+        else:
+            _log_deletion_error(log, file_path, base_images_dir, error)
             error_count += 1
 
-    print(f"--- Deletion Summary: {deleted_count} deleted, {error_count} errors/skipped. ---")
-    return deleted_count, error_count
\ No newline at end of file
+    if deleted_lines:
+        sys.stdout.write("Deleted:\n  " + "\n  ".join(deleted_lines) + "\n")
+    if log_lines:
+        sys.stdout.write("\n".join(log_lines) + "\n")
+    if verbose:
+        print(f"--- Deletion Summary: {deleted_count} deleted, {error_count} errors/skipped. ---")
+    return deleted_count, error_count, deleted_files
@@ -5,44 +5,17 @@ Tkinter-based GUI for reviewing and marking unused image files for deletion.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Set, List, Optional
+from typing import Dict, Set, List, Optional, Tuple
 import io  # For SVG handling
+import os
+import threading
 
 from PIL import Image, ImageTk, UnidentifiedImageError, ImageFile
 
-
-def perform_safe_deletion(files_to_delete, base_dir):
-    print(f"--- Placeholder Deletion ---")
-    deleted_count = 0
-    error_count = 0
-    if not files_to_delete:
-        print("No files marked for deletion.")
-        return 0, 0
-    print(f"Would delete {len(files_to_delete)} files from {base_dir}:")
-    files_successfully_deleted = set() # Keep track of simulated successes
-    for f in sorted(list(files_to_delete)):
-        try:
-            rel_path = f.relative_to(base_dir)
-        except ValueError:
-            rel_path = f
-        try:
-            f.unlink() # Or use send2trash
-            print(f"   [DELETED] {rel_path}")
-            deleted_count += 1
-            files_successfully_deleted.add(f) # Track success
-        except Exception as e:
-            print(f"   [ERROR] Failed to delete {rel_path}: {e}")
-            error_count += 1
-
-    # Simulate all deletions successful for placeholder
-    deleted_count = len(files_to_delete)
-    error_count = 0
-    files_successfully_deleted = set(files_to_delete)
-    print(f"--- End Placeholder Deletion (Simulated: {deleted_count} deleted, {error_count} errors) ---")
-    # Return simulated counts and the set of files 'deleted'
-    return deleted_count, error_count, files_successfully_deleted
-# --- End Placeholder ---
+from file_utils import TRASH_SUPPORT, perform_safe_deletion
 
 
 # Handle truncated images (optional, but often useful)
@@ -60,11 +33,72 @@ except ImportError:
     print("Install using: pip install cairosvg")
 
 
+# Rasterized SVGs keyed by (path, mtime_ns, width, height), sizes snapped to 16px bins
+# so nearby resize events share an entry. Filled from worker threads, hence the lock.
+_SVG_CACHE_MAX = 8
+_svg_png_cache: OrderedDict[Tuple[str, int, int, int], bytes] = OrderedDict()
+_svg_cache_lock = threading.Lock()
+
+
+def _render_svg(filepath: Path, target_w: int, target_h: int) -> bytes:
+    """Rasterizes an SVG to PNG bytes with cairosvg, reusing cached renders."""
+    path_s = str(filepath)
+    key = (path_s, os.stat(path_s).st_mtime_ns, target_w // 16 * 16, target_h // 16 * 16)
+    with _svg_cache_lock:
+        png_bytes = _svg_png_cache.get(key)
+        if png_bytes is not None:
+            _svg_png_cache.move_to_end(key)
+            return png_bytes
+
+    png_bytes = cairosvg.svg2png(
+        bytestring=filepath.read_bytes(),
+        url=path_s, # Base for relative references inside the SVG
+        output_width=target_w,
+        output_height=target_h,
+        parent_width=target_w,
+        parent_height=target_h
+    )
+    if not png_bytes:
+        raise ValueError("cairosvg returned empty output")
+
+    with _svg_cache_lock:
+        _svg_png_cache[key] = png_bytes
+        if len(_svg_png_cache) > _SVG_CACHE_MAX:
+            _svg_png_cache.popitem(last=False)
+    return png_bytes
+
+
+def _decode_resize(filepath: Path, target_w: int, target_h: int) -> Tuple[str, Tuple[int, int], bytes]:
+    """
+    Decodes and thumbnails an image. Runs on a worker thread, so it must not touch Tk.
+    Pillow releases the GIL while decoding and resampling, keeping the UI responsive.
+
+    Returns:
+        A (mode, size, raw_bytes) tuple for Image.frombytes() on the main thread.
+    """
+    if filepath.suffix.lower() == '.svg':
+        img = Image.open(io.BytesIO(_render_svg(filepath, target_w, target_h)))
+        img.load()
+    else:
+        img = Image.open(filepath)
+        # Convert modes for Tkinter compatibility; the common RGB/RGBA case needs no copy
+        mode = img.mode
+        if mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGBA' if mode == 'P' or 'A' in mode else 'RGB')
+        # thumbnail() already box-reduces before the LANCZOS pass (default reducing_gap=2.0)
+        img.thumbnail((target_w, target_h), Image.Resampling.LANCZOS)
+    return img.mode, img.size, img.tobytes()
+
+
 class UnusedImageViewer:
     """
     GUI window to display potentially unused images and allow marking for deletion.
     """
 
+    _THUMB_CACHE_MAX = 16  # Number of rendered thumbnails kept for prev/next navigation
+    _DELETE_BATCH_SIZE = 100  # Files deleted per idle callback, keeping the window responsive
+    _DELETE_WORKERS = 8  # Threads unlinking files within a batch
+
     # pylint: disable=too-many-instance-attributes # GUI classes often have many attributes
     def __init__(self, master: tk.Tk, unused_files: Set[Path], base_images_dir: Path):
         """
@@ -77,14 +111,31 @@ class UnusedImageViewer:
         """
         self.master = master
         # Sort files for consistent navigation order
-        self.unused_files: List[Path] = sorted(list(unused_files))
+        # Plain string keys compare in C instead of Path's tuple-of-parts comparison
+        self.unused_files: List[Path] = []
+        self._index_by_str: Dict[str, int] = {}  # os.fspath(path) -> position in unused_files
+        self._set_unused_files(sorted(unused_files, key=os.fspath))
         self.base_images_dir = base_images_dir.resolve()  # Ensure absolute path
         self.current_index: int = 0
-        self.files_to_delete: Set[Path] = set()
+        # Marked files as os.fspath() strings, which hash cheaper than Path objects
+        self.files_to_delete: Set[str] = set()
+        self._rel_cache: Dict[Path, str] = {}  # Path -> display path relative to base_images_dir
+        self._deleting = False  # True while batched deletion is in progress
         self.image_cache: Optional[ImageTk.PhotoImage] = None  # Keep reference
+        # Decoding/resizing runs here; only PhotoImage creation stays on the Tk thread
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        # LRU of rendered thumbnails keyed by (path, snapped width, snapped height);
+        # values are (photo, PIL mode), the mode being needed to recycle the buffer
+        self._thumb_cache: OrderedDict[Tuple[Path, int, int], Tuple[ImageTk.PhotoImage, str]] = OrderedDict()
+        self._pending_decodes: Dict[Tuple[Path, int, int], Future] = {}
+        # Last thumbnail evicted from the cache and its mode; its Tk buffer is reused for
+        # the next image of the same size and mode (common for backgrounds sharing one resolution)
+        self._recycled_photo: Optional[Tuple[ImageTk.PhotoImage, str]] = None
 
         # Variable for the delete checkbox
         self.delete_var = tk.BooleanVar()
+        # Move marked files to the system trash instead of deleting them (needs 'send2trash')
+        self.use_trash_var = tk.BooleanVar(value=TRASH_SUPPORT)
 
         if not self.unused_files:
             messagebox.showinfo("No Unused Images", "No unused image files found to review.")
@@ -119,6 +170,11 @@ class UnusedImageViewer:
         self.image_label.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         self.image_frame.bind("<Configure>", self._on_resize)
         self._last_frame_size = (0, 0)
+        # Frame size as reported by the last <Configure> event, saves winfo_* round trips
+        self._frame_w = 0
+        self._frame_h = 0
+        self._after_id: Optional[str] = None
+        self._resize_token = 0
 
         # Control Frame Layout
         self.control_frame = ttk.Frame(main_frame)
@@ -142,6 +198,15 @@ class UnusedImageViewer:
         )
         self.delete_checkbox.grid(row=0, column=3, padx=(10, 0), sticky=tk.E) # Column 3
 
+        # Trash Checkbox, only usable when 'send2trash' is installed
+        self.trash_checkbox = ttk.Checkbutton(
+            button_container,
+            text="Move to Trash",
+            variable=self.use_trash_var,
+            state=tk.NORMAL if TRASH_SUPPORT else tk.DISABLED
+        )
+        self.trash_checkbox.grid(row=0, column=4, padx=(10, 0), sticky=tk.E) # Column 4
+
         # Buttons
         # --- "Delete Marked" Button ---
         self.commit_delete_button = ttk.Button(button_container, text="Delete Marked", command=self.commit_deletions)
@@ -169,22 +234,35 @@ class UnusedImageViewer:
 
     def _on_resize(self, event=None):
         """Handle window resize events to reload image with new thumbnail size."""
-        new_size = (self.image_frame.winfo_width(), self.image_frame.winfo_height())
-        if new_size != self._last_frame_size and new_size[0] > 1 and new_size[1] > 1:
-            if self.master.winfo_viewable():
-                self._last_frame_size = new_size
-                if hasattr(self, '_after_id') and self._after_id:
-                    self.master.after_cancel(self._after_id)
-                self._after_id = self.master.after(200, self._load_image_if_ready)
+        if event is not None:
+            new_w, new_h = event.width, event.height
+        else:
+            new_w, new_h = self.image_frame.winfo_width(), self.image_frame.winfo_height()
+        self._frame_w, self._frame_h = new_w, new_h
+        last_w, last_h = self._last_frame_size
+        # Changes below the thumbnail cache granularity keep the current image
+        if abs(new_w - last_w) < 32 and abs(new_h - last_h) < 32:
+            return
+        if new_w > 1 and new_h > 1 and self.master.winfo_viewable():
+            self._last_frame_size = (new_w, new_h)
+            # Invalidates loads scheduled for the previous size
+            self._resize_token += 1
+            if self._after_id:
+                self.master.after_cancel(self._after_id)
+            self._after_id = self.master.after(250, self._load_image_if_ready)
 
     def _load_image_if_ready(self):
         """Check if frame size is stable before loading"""
         self._after_id = None
-        if self.image_frame.winfo_exists() and self.image_frame.winfo_width() > 1 and self.image_frame.winfo_height() > 1:
+        if self._frame_w > 1 and self._frame_h > 1:
              self.load_image()
 
     def _update_status(self):
         """Updates the status label, checkbox, and button states based on current image and marked files."""
+        if self._deleting:
+            # Image loads finishing during a batched deletion must not re-enable the
+            # controls; _finish_deletion updates them once the last batch is done
+            return
         list_len = len(self.unused_files)
         is_list_empty = list_len == 0
         is_last_image = not is_list_empty and (self.current_index == list_len - 1)
@@ -208,12 +286,8 @@ class UnusedImageViewer:
 
         # --- Normal status update for a valid image ---
         current_path = self.unused_files[self.current_index]
-        is_current_marked = current_path in self.files_to_delete
-
-        try:
-            relative_path = current_path.relative_to(self.base_images_dir)
-        except ValueError:
-            relative_path = current_path
+        is_current_marked = os.fspath(current_path) in self.files_to_delete
+        relative_path = self._relative_path(current_path)
 
         status = f"Image {self.current_index + 1} of {list_len}: {relative_path}"
         if is_current_marked:
@@ -232,19 +306,20 @@ class UnusedImageViewer:
 
     def _toggle_delete_mark(self):
         """Toggles the deletion mark for the current image via checkbox click."""
-        if not self.unused_files or self.current_index >= len(self.unused_files):
+        if self._deleting or not self.unused_files or self.current_index >= len(self.unused_files):
             return
 
         current_file = self.unused_files[self.current_index]
+        current_key = os.fspath(current_file)
         is_marked_now = self.delete_var.get() # State AFTER click
 
         if is_marked_now:
-            if current_file not in self.files_to_delete:
-                self.files_to_delete.add(current_file)
+            if current_key not in self.files_to_delete:
+                self.files_to_delete.add(current_key)
                 print(f"Marked: {current_file.name}")
         else:
-            if current_file in self.files_to_delete:
-                self.files_to_delete.discard(current_file)
+            if current_key in self.files_to_delete:
+                self.files_to_delete.discard(current_key)
                 print(f"Unmarked: {current_file.name}")
 
         # Update status label and button states (especially commit button)
@@ -255,39 +330,25 @@ class UnusedImageViewer:
         if str(self.delete_checkbox.cget('state')) == tk.NORMAL:
             self.delete_checkbox.invoke() # Simulate a click, triggers _toggle_delete_mark
 
+    def _relative_path(self, filepath: Path) -> str:
+        """Returns filepath relative to base_images_dir for display, memoized per file."""
+        relative_path = self._rel_cache.get(filepath)
+        if relative_path is None:
+            try:
+                relative_path = str(filepath.relative_to(self.base_images_dir))
+            except ValueError:
+                relative_path = str(filepath)
+            self._rel_cache[filepath] = relative_path
+        return relative_path
+
     def _display_error(self, filepath: Path, message: str):
         """Helper to display an error message in the image label."""
-        try:
-            relative_path = filepath.relative_to(self.base_images_dir)
-        except ValueError:
-            relative_path = filepath.name
-        error_text = f"{message}:\n{relative_path}"
+        error_text = f"{message}:\n{self._relative_path(filepath)}"
         self.image_label.config(image='', text=error_text)
         self.image_cache = None
         self.image_label.image = None
         self._update_status() # Update status/buttons even on error
 
-    def _load_svg(self, filepath: Path, target_w: int, target_h: int) -> Optional[Image.Image]:
-        """Loads and renders an SVG file if cairosvg is available."""
-        if not SVG_SUPPORT or cairosvg is None:
-            self._display_error(filepath, "SVG preview requires 'cairosvg'")
-            return None
-        try:
-            png_bytes = cairosvg.svg2png(
-                url=str(filepath),
-                output_width=target_w,
-                output_height=target_h,
-                parent_width=target_w,
-                parent_height=target_h
-            )
-            if not png_bytes:
-                raise ValueError("cairosvg returned empty output")
-            return Image.open(io.BytesIO(png_bytes))
-        except Exception as svg_e:
-            print(f"Error rendering SVG {filepath}: {svg_e}")
-            self._display_error(filepath, f"Error rendering SVG: {svg_e}")
-            return None
-
     def load_image(self, event=None):
         """Loads and displays the image at the current index."""
         if not self.unused_files:
@@ -309,54 +370,142 @@ class UnusedImageViewer:
 
         filepath = self.unused_files[self.current_index]
 
-        frame_w = self.image_frame.winfo_width()
-        frame_h = self.image_frame.winfo_height()
+        frame_w, frame_h = self._frame_w, self._frame_h
+        if frame_w <= 1 or frame_h <= 1: # No <Configure> event seen yet
+            frame_w = self.image_frame.winfo_width()
+            frame_h = self.image_frame.winfo_height()
         target_w = max(100, frame_w - 20)
         target_h = max(100, frame_h - 20)
 
         self.image_label.config(image='', text=f"Loading {filepath.name}...")
         self._update_status() # Update status/buttons before potentially slow load
 
-        self.master.after(10, self._load_image_task, filepath, target_w, target_h)
+        self.master.after(10, self._load_image_task, filepath, target_w, target_h, self._resize_token)
+
 
+    def _set_unused_files(self, files: List[Path]):
+        """Replaces the review list and rebuilds the path string -> position index."""
+        self.unused_files = files
+        self._index_by_str = {os.fspath(f): i for i, f in enumerate(files)}
 
-    def _load_image_task(self, filepath, target_w, target_h):
-        """The actual image loading part, run via 'after'."""
+    def _is_current(self, filepath: Path) -> bool:
+        """Returns True if filepath is still the image at the current index."""
+        return self._index_by_str.get(os.fspath(filepath)) == self.current_index
+
+    @staticmethod
+    def _thumb_key(filepath: Path, target_w: int, target_h: int) -> Tuple[Path, int, int]:
+        """Cache key for a thumbnail; sizes are snapped so small resize jitter still hits."""
+        return filepath, target_w // 32 * 32, target_h // 32 * 32
+
+    def _show_photo(self, photo: ImageTk.PhotoImage):
+        """Displays an already created PhotoImage in the image label."""
+        self.image_cache = photo
+        self.image_label.config(image=self.image_cache, text="")
+        self.image_label.image = self.image_cache
+        # Update status again after successful load to ensure correct button states
+        self._update_status()
+
+    def _load_image_task(self, filepath, target_w, target_h, resize_token):
+        """Shows the cached thumbnail or submits decoding to the worker pool, run via 'after'."""
         # Check if index/file changed while load was pending
-        if not self.unused_files or self.current_index >= len(self.unused_files) or self.unused_files[self.current_index] != filepath:
+        if not self._is_current(filepath):
             print(f"Skipping load for {filepath.name}, index changed.")
             return
+        # A resize since scheduling means a reload for the new size is already pending
+        if resize_token != self._resize_token:
+            return
+
+        key = self._thumb_key(filepath, target_w, target_h)
+        cached = self._thumb_cache.get(key)
+        if cached is not None:
+            self._thumb_cache.move_to_end(key)
+            self._show_photo(cached[0])
+            self._prefetch_neighbors(target_w, target_h)
+            return
+
+        if filepath.suffix.lower() == '.svg' and (not SVG_SUPPORT or cairosvg is None):
+            self._display_error(filepath, "SVG preview requires 'cairosvg'")
+            return
 
+        future = self._decode_async(filepath, target_w, target_h)
+        future.add_done_callback(lambda f: self._schedule_on_tk(self._apply_decoded, f, key, resize_token))
+
+    def _decode_async(self, filepath: Path, target_w: int, target_h: int) -> Future:
+        """Submits a decode, reusing one already in flight for the same thumbnail."""
+        key = self._thumb_key(filepath, target_w, target_h)
+        future = self._pending_decodes.get(key)
+        if future is None:
+            future = self._executor.submit(_decode_resize, filepath, target_w, target_h)
+            self._pending_decodes[key] = future
+            # Registered first, so the thumbnail is cached before it is displayed
+            future.add_done_callback(lambda f: self._schedule_on_tk(self._store_decoded, f, key))
+        return future
+
+    def _prefetch_neighbors(self, target_w: int, target_h: int):
+        """Decodes the previous and next image in the background so navigation is instant."""
+        for index in (self.current_index + 1, self.current_index - 1):
+            if 0 <= index < len(self.unused_files):
+                filepath = self.unused_files[index]
+                if filepath.suffix.lower() == '.svg' and not SVG_SUPPORT:
+                    continue
+                if self._thumb_key(filepath, target_w, target_h) not in self._thumb_cache:
+                    self._decode_async(filepath, target_w, target_h)
+
+    def _schedule_on_tk(self, callback, *args):
+        """Called on the worker thread; hands the result back to the Tk thread."""
         try:
-            img: Optional[Image.Image] = None
-            is_svg = filepath.suffix.lower() == '.svg'
+            self.master.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            pass # Window was closed while the image was decoding
+
+    def _make_photo(self, img: Image.Image) -> ImageTk.PhotoImage:
+        """Creates a PhotoImage, pasting into the recycled Tk buffer when size and mode match."""
+        if self._recycled_photo is not None:
+            recycled, recycled_mode = self._recycled_photo
+            # paste() converts to the photo's original mode, so an RGBA image pasted
+            # into an RGB buffer would lose its transparency
+            if recycled_mode == img.mode and (recycled.width(), recycled.height()) == img.size:
+                self._recycled_photo = None
+                recycled.paste(img)
+                return recycled
+        return ImageTk.PhotoImage(img)
+
+    def _store_decoded(self, future: Future, key: Tuple[Path, int, int]):
+        """Turns a finished decode into a PhotoImage and adds it to the LRU cache (Tk thread only)."""
+        self._pending_decodes.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            return # Errors are reported by _apply_decoded if the image is shown
+        mode, size, data = future.result()
+        if size[0] <= 0 or size[1] <= 0:
+            return
+        self._thumb_cache[key] = (self._make_photo(Image.frombytes(mode, size, data)), mode)
+        self._thumb_cache.move_to_end(key)
+        if len(self._thumb_cache) > self._THUMB_CACHE_MAX:
+            _, evicted = self._thumb_cache.popitem(last=False)
+            if evicted[0] is not self.image_cache:
+                self._recycled_photo = evicted
+
+    def _apply_decoded(self, future: Future, key: Tuple[Path, int, int], resize_token: int):
+        """Displays a finished decode (Tk thread only)."""
+        filepath = key[0]
+        # Drop stale decodes if the user navigated away or resized in the meantime
+        if not self._is_current(filepath) or resize_token != self._resize_token:
+            return
 
-            if is_svg:
-                img = self._load_svg(filepath, target_w, target_h)
-            else:
-                img = Image.open(filepath)
-                # Convert modes for Tkinter compatibility
-                if img.mode == 'P': img = img.convert('RGBA')
-                elif img.mode == 'LA': img = img.convert('RGBA')
-                elif img.mode not in ('RGB', 'RGBA'):
-                    try: img = img.convert('RGBA')
-                    except Exception:
-                        try: img = img.convert('RGB')
-                        except Exception as conv_e:
-                            raise ValueError(f"Unsupported image mode: {img.mode}") from conv_e
-                img.thumbnail((target_w, target_h), Image.Resampling.LANCZOS)
-
-            if img is None: return # Error handled in specific loader
-
-            if img.width <= 0 or img.height <= 0:
+        cached = self._thumb_cache.get(key)
+        if cached is not None:
+            self._show_photo(cached[0])
+            self._prefetch_neighbors(key[1], key[2])
+            return
+
+        try:
+            mode, size, data = future.result()
+
+            if size[0] <= 0 or size[1] <= 0:
                 self._display_error(filepath, "Image processed to zero size")
                 return
 
-            self.image_cache = ImageTk.PhotoImage(img)
-            self.image_label.config(image=self.image_cache, text="")
-            self.image_label.image = self.image_cache
-            # Update status again after successful load to ensure correct button states
-            self._update_status()
+            self._show_photo(self._make_photo(Image.frombytes(mode, size, data)))
 
         except UnidentifiedImageError:
             self._display_error(filepath, "Cannot open or identify image file")
@@ -364,6 +513,10 @@ class UnusedImageViewer:
             self._display_error(filepath, "File not found (already deleted?)")
             self._remove_current_file_from_list(update_view=True) # Remove and reload view
         except Exception as e:
+            if filepath.suffix.lower() == '.svg':
+                print(f"Error rendering SVG {filepath}: {e}")
+                self._display_error(filepath, f"Error rendering SVG: {e}")
+                return
             print(f"Error loading image {filepath}: {type(e).__name__}: {e}")
             import traceback
             traceback.print_exc()
@@ -395,7 +548,8 @@ class UnusedImageViewer:
         current_file = self.unused_files[self.current_index]
         print(f"Removing file from review list: {current_file.name}")
         self.unused_files.pop(self.current_index)
-        self.files_to_delete.discard(current_file) # Ensure it's not marked
+        self._set_unused_files(self.unused_files)
+        self.files_to_delete.discard(os.fspath(current_file)) # Ensure it's not marked
 
         # Adjust index if necessary (stay at current index unless it was the last)
         if self.current_index >= len(self.unused_files) and len(self.unused_files) > 0:
@@ -415,6 +569,7 @@ class UnusedImageViewer:
         self.next_nav_button.config(state=tk.DISABLED)
         self.prev_nav_button.config(state=tk.DISABLED)
         self.delete_checkbox.config(state=tk.DISABLED)
+        self.trash_checkbox.config(state=tk.DISABLED)
         # Keep Escape key binding maybe? Or disable all interaction? Let's unbind nav/action keys.
         self.master.unbind("<Left>")
         self.master.unbind("<Right>")
@@ -427,66 +582,46 @@ class UnusedImageViewer:
     def _reenable_ui_after_action(self):
         """Re-enables UI elements and re-binds keys after an action."""
         self._bind_events() # Rebind keys
+        if TRASH_SUPPORT:
+            self.trash_checkbox.config(state=tk.NORMAL)
         self._update_status() # Update button states based on current status
 
     def _prompt_and_perform_deletion(self) -> bool:
         """
-        Asks for confirmation and performs deletion of marked files.
-        Updates the internal lists and view after deletion.
+        Asks for confirmation and starts deletion of marked files.
+        The files are deleted in batches; the internal lists and view are updated
+        by _finish_deletion once the last batch is done.
         Returns True if the user confirmed (Yes or No), False if they Cancelled.
         Closes the window if deletion is performed or user chooses "No".
         """
+        if self._deleting:
+            return False # A deletion is already running
         if not self.files_to_delete:
             messagebox.showinfo("No Action", "No images are currently marked for deletion.")
             return True # No cancellation, just nothing to do.
 
         count = len(self.files_to_delete)
+        use_trash = TRASH_SUPPORT and self.use_trash_var.get()
+        action = "Move" if use_trash else "Permanently delete"
+        destination = " to the trash" if use_trash else ""
         msg = f"{count} image{'s' if count != 1 else ''} marked for deletion.\n\n" \
-              f"Permanently delete {'these' if count != 1 else 'this'} file{'s' if count != 1 else ''}?"
+              f"{action} {'these' if count != 1 else 'this'} file{'s' if count != 1 else ''}{destination}?"
         confirm = messagebox.askyesnocancel("Confirm Deletion", msg, icon='warning')
 
         if confirm is True:  # Yes, delete
             print(f"Proceeding to delete {count} files...")
+            self._deleting = True
             self._disable_ui_during_action()
             self.status_label.config(text=f"Deleting {count} files...")
-            self.master.update_idletasks()
-
-            # Perform deletion
-            # IMPORTANT: Use a copy of the set for iteration if modifying the list below
-            files_to_attempt_delete = self.files_to_delete.copy()
-            deleted_count, error_count, successfully_deleted_files = perform_safe_deletion(
-                files_to_attempt_delete, self.base_images_dir
-            )
-
-            info_msg = f"Deletion finished.\nDeleted: {deleted_count}\nErrors/Skipped: {error_count}"
-            messagebox.showinfo("Deletion Complete", info_msg)
-
-            # --- Update internal state ---
-            # Remove successfully deleted files from the main list and the marked set
-            self.files_to_delete.difference_update(successfully_deleted_files) # Remove deleted from marked set
-            original_list_len = len(self.unused_files)
-            self.unused_files = [f for f in self.unused_files if f not in successfully_deleted_files]
-            files_removed_from_list = original_list_len - len(self.unused_files)
-            print(f"Removed {files_removed_from_list} files from the review list.")
-
-            if not self.unused_files:
-                self.current_index = 0
-                self.image_label.config(image='', text="No images left to review.")
-                self._update_status() # Update controls for empty list
-            elif self.current_index >= len(self.unused_files):
-                self.current_index = len(self.unused_files) - 1
-                self.load_image() # Load last image
-            else:
-                # Still valid files, load image at current index (which might be a new image)
-                self.load_image()
-            self._reenable_ui_after_action() # Re-enable UI
-            return True
 
+            # Perform deletion in batches from idle callbacks, so the window keeps redrawing
+            files_to_attempt_delete = sorted(self.files_to_delete)
+            self.master.after_idle(self._delete_batch, files_to_attempt_delete, 0, 0, 0, set(), use_trash)
+            return True
 
         elif confirm is False:  # No, don't delete, just quit
             print("Quitting without deleting marked files.")
-            self.master.quit()
-            self.master.destroy()
+            self._close_window()
             return True # User made a choice (Yes/No)
         else:  # Cancel
             print("Deletion cancelled.")
@@ -494,12 +629,71 @@ class UnusedImageViewer:
             # self._reenable_ui_after_action() # Not strictly needed here, but good practice
             return False # User cancelled
 
+    def _delete_batch(self, files: List[str], start: int, deleted_count: int, error_count: int,
+                      successfully_deleted_files: Set[Path], use_trash: bool = False):
+        """Deletes the next batch of marked files and schedules the following one."""
+        batch = {Path(f) for f in files[start:start + self._DELETE_BATCH_SIZE]}
+        batch_deleted, batch_errors, batch_done = perform_safe_deletion(
+            batch, self.base_images_dir, use_trash=use_trash, verbose=False, workers=self._DELETE_WORKERS
+        )
+        deleted_count += batch_deleted
+        error_count += batch_errors
+        successfully_deleted_files |= batch_done
+
+        start += self._DELETE_BATCH_SIZE
+        if start < len(files):
+            self.status_label.config(text=f"Deleting files... {start} of {len(files)}")
+            self.master.after_idle(self._delete_batch, files, start, deleted_count, error_count,
+                                   successfully_deleted_files, use_trash)
+        else:
+            self._finish_deletion(deleted_count, error_count, successfully_deleted_files)
+
+    def _finish_deletion(self, deleted_count: int, error_count: int, successfully_deleted_files: Set[Path]):
+        """Reports the deletion result and updates the internal lists and view."""
+        print(f"--- Deletion Summary: {deleted_count} deleted, {error_count} errors/skipped. ---")
+        info_msg = f"Deletion finished.\nDeleted: {deleted_count}\nErrors/Skipped: {error_count}"
+        messagebox.showinfo("Deletion Complete", info_msg)
+
+        # --- Update internal state ---
+        # Remove successfully deleted files from the main list and the marked set
+        deleted_keys = {os.fspath(f) for f in successfully_deleted_files}
+        self.files_to_delete.difference_update(deleted_keys) # Remove deleted from marked set
+        original_list_len = len(self.unused_files)
+        current_key = os.fspath(self.unused_files[self.current_index]) \
+            if self.current_index < original_list_len else None
+        self._set_unused_files([f for f in self.unused_files if os.fspath(f) not in deleted_keys])
+        files_removed_from_list = original_list_len - len(self.unused_files)
+        print(f"Removed {files_removed_from_list} files from the review list.")
+        # Stay on the image that was shown if it survived, otherwise keep the position
+        self.current_index = self._index_by_str.get(current_key, self.current_index)
+
+        self._deleting = False
+        if not self.unused_files:
+            self.current_index = 0
+            self.image_label.config(image='', text="No images left to review.")
+            self._update_status() # Update controls for empty list
+        elif self.current_index >= len(self.unused_files):
+            self.current_index = len(self.unused_files) - 1
+            self.load_image() # Load last image
+        else:
+            # Still valid files, load image at current index (which might be a new image)
+            self.load_image()
+        self._reenable_ui_after_action() # Re-enable UI
+
+    def _close_window(self):
+        """Stops pending image decodes and closes the viewer."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.master.quit()
+        self.master.destroy()
+
     def commit_deletions(self, event=None):
         """Handles the 'Delete Marked' button click."""
         self._prompt_and_perform_deletion()
 
     def confirm_quit(self, event=None):
         """Handles window close or Escape key."""
+        if self._deleting:
+            return # Let the running deletion finish first
         if self.files_to_delete:
             # If files are marked, use the standard deletion prompt which handles Yes/No/Cancel
             self._prompt_and_perform_deletion()
@@ -508,5 +702,4 @@ class UnusedImageViewer:
         else:
             # No files marked, just ask to quit
             if messagebox.askyesno("Quit", "No images marked for deletion.\nQuit review?"):
-                self.master.quit()
-                self.master.destroy()
\ No newline at end of file
+                self._close_window()
\ No newline at end of file
@@ -1,15 +1,18 @@
+import multiprocessing
 import sys
-import tkinter as tk
-import sv_ttk
 from pathlib import Path
 from typing import Optional, Tuple
 
 from config import SCRIPT_DIR_NAMES
-from file_utils import get_image_names
-from gui_viewer import UnusedImageViewer
+from file_utils import get_image_stem_map, iter_files
 from script_parser import extract_image_references
 
 
+def _has_any_rpy(root: Path) -> bool:
+    """Returns True as soon as one .rpy file is found below root, without walking the rest."""
+    return next(iter_files(root, ('.rpy',)), None) is not None
+
+
 def find_project_paths(base_dir: Path) -> Tuple[Optional[Path], Optional[Path]]:
     """
     Attempts to automatically find the script and images directories
@@ -33,14 +36,14 @@ def find_project_paths(base_dir: Path) -> Tuple[Optional[Path], Optional[Path]]:
     # Find script directory (game/scripts or just game)
     for name in SCRIPT_DIR_NAMES:
          potential_script_dir = game_dir / name
-         if potential_script_dir.is_dir() and any(potential_script_dir.rglob('*.rpy')):
+         if potential_script_dir.is_dir() and _has_any_rpy(potential_script_dir):
               script_dir = potential_script_dir
               print(f"Found script directory: {script_dir}")
               break # Prefer game/script if it exists and has files
 
     if not script_dir:
          # Fallback to game dir itself if it has .rpy files directly
-         if any(game_dir.rglob('*.rpy')):
+         if _has_any_rpy(game_dir):
               script_dir = game_dir
               print(f"Found script files directly in: {script_dir}")
          else:
@@ -82,7 +85,7 @@ def get_paths_from_user() -> Tuple[Optional[Path], Optional[Path]]:
         if not script_dir.is_dir():
             print(f"Error: Script directory not found: {script_dir}")
             valid = False
-        elif not any(script_dir.rglob('*.rpy')):
+        elif not _has_any_rpy(script_dir):
              print(f"Warning: No .rpy files found in the specified script directory: {script_dir}")
              # Allow proceeding but warn user
 
@@ -122,8 +125,9 @@ def run_analysis():
          sys.exit(1)
 
     print("\nScanning image files...")
-    # Dict: relative_stem (using '/') -> Absolute Path object
-    all_image_paths, all_image_names = get_image_names(images_dir)
+    # Dict: stem -> absolute paths (using '/') of the files with that stem
+    image_stem_map = get_image_stem_map(images_dir)
+    all_image_names = image_stem_map.keys()
 
     print("\nScanning script files for image references...")
     # Set of stems/relative paths (using '/') found in scripts
@@ -132,7 +136,7 @@ def run_analysis():
     # --- Determine Unused Images ---
     # An image is considered used if its relative stem (e.g., "chars/eileen_happy", "bg_room")
     # matches a reference found in the scripts.
-    unused_stems = all_image_names.difference(used_image_references)
+    unused_stems = all_image_names - used_image_references
 
     print(f"\nFound {len(all_image_names)} unique image files (by stem/relative path).")
     print(f"Found {len(used_image_references)} unique image references in scripts.")
@@ -145,12 +149,13 @@ def run_analysis():
 
     print(f"\nFound {len(unused_stems)} potentially unused image files (excluding internal).")
 
-    # Get the full Path objects for the unused stems
-    unused_files_paths = [
-        Path(path)  # <-- Explicitly convert to Path object here
-        for path in all_image_paths
-        if Path(path).stem in unused_stems
-    ]
+    # Get the full Path objects for the unused stems; only these become Path objects.
+    # Built directly as a set, without an intermediate list
+    unused_files_paths = {
+        Path(path)
+        for stem in unused_stems
+        for path in image_stem_map[stem]
+    }
 
     print("\nLaunching Unused Image Reviewer...")
     print("-------------------------------------")
@@ -158,11 +163,19 @@ def run_analysis():
     print("  - Left/Right Arrows or < / > buttons: Navigate images.")
     print("  - Delete Key or 'Delete' button: Deletes marked images.")
     print("  - Esc Key or Window Close [X]: Opens deletion confirmation dialog.")
+    print("  - 'Move to Trash' checkbox: Send deleted images to the trash (requires send2trash).")
     print("-------------------------------------")
 
 
+    # GUI modules are imported here rather than at module level: the script parser's
+    # worker processes re-import this module under the 'spawn' start method (Windows,
+    # macOS) and must not load Pillow/Tk or print the optional dependency notices again
+    import tkinter as tk
+    import sv_ttk
+    from gui_viewer import UnusedImageViewer
+
     root = tk.Tk()
-    app = UnusedImageViewer(root, set(unused_files_paths), images_dir)
+    app = UnusedImageViewer(root, unused_files_paths, images_dir)
 
     # --- Bring window to front and give focus ---
     root.lift()
@@ -179,6 +192,8 @@ def run_analysis():
 
 
 if __name__ == "__main__":
+    # Needed for the script parser's worker processes in the frozen release binary
+    multiprocessing.freeze_support()
     try:
         run_analysis()
     except KeyboardInterrupt:
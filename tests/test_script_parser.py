@@ -0,0 +1,85 @@
+"""
+Tests for finding image references in Ren'Py scripts.
+"""
+
+import os
+import re
+import tempfile
+import unittest
+
+from config import DEFINE_IMAGE_PATTERN, IMAGEBUTTON_PATTERN, SHOW_SCENE_PATTERN
+from script_parser import _parse_file
+
+
+# Ren'Py-style sample covering every kind of reference, including bare 'scene'
+# statements and lines that start right after a reference on the previous line
+SAMPLE_SCRIPT = """\
+image title = "gui/title.png"
+image eileen happy = "eileen_happy.png"
+image côté = "côté.png"
+
+label start:
+    scene
+    show eileen happy at left
+    scene bg room
+    scene
+image late = "late.png"
+    show chars/lucy mad
+    SHOW Upper
+    "show not_a_statement"
+    scene
+    imagebutton auto "gui/button_%s.png" action Return()
+
+screen nav():
+    imagebutton hover "images/menu_hover.png" action NullAction()
+    imagebutton "plain.png"
+    imagebutton auto "noext_%s" action NullAction()
+    return
+"""
+
+
+def _parse_three_pass(text: str):
+    """Reference result: each pattern scanned separately, as before they were combined."""
+    content = text.encode('utf-8')
+    refs = set()
+    for pattern in (SHOW_SCENE_PATTERN, DEFINE_IMAGE_PATTERN):
+        for match in re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE):
+            refs.add(match.group(1).replace(b'\\', b'/').decode('utf-8'))
+    for match in re.finditer(IMAGEBUTTON_PATTERN, content, re.IGNORECASE):
+        base_path = re.sub(r'%.', '', match.group(1).strip().replace(b'\\', b'/').decode('utf-8')).strip()
+        base_path = os.path.splitext(base_path)[0] if '.' in os.path.basename(base_path) else base_path
+        if base_path:
+            refs.add(base_path)
+    return refs
+
+
+def _parse_text(text: str):
+    """Writes text to a temporary .rpy file and parses it."""
+    with tempfile.TemporaryDirectory() as tmp:
+        filepath = os.path.join(tmp, 'script.rpy')
+        with open(filepath, 'w', encoding='utf-8') as file:
+            file.write(text)
+        return _parse_file(filepath)
+
+
+class ParseFileTests(unittest.TestCase):
+
+    def test_show_and_scene(self):
+        refs = _parse_text("label start:\n    scene bg room\n    show eileen happy\n")
+        self.assertEqual(refs, {'bg', 'eileen'})
+
+    def test_bare_scene_does_not_hide_next_show(self):
+        refs = _parse_text("label start:\n    scene\n    show eileen happy\n")
+        self.assertIn('eileen', refs)
+        self.assertNotIn('show', refs)
+
+    def test_bare_scene_does_not_hide_next_image_definition(self):
+        refs = _parse_text("    scene\nimage title = \"t.png\"\n")
+        self.assertIn('title', refs)
+
+    def test_single_pass_matches_separate_scans(self):
+        self.assertEqual(_parse_text(SAMPLE_SCRIPT), _parse_three_pass(SAMPLE_SCRIPT))
+
+
+if __name__ == '__main__':
+    unittest.main()